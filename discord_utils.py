@@ -0,0 +1,50 @@
+from typing import Optional
+import asyncio
+import discord
+
+class EmbedStreamer:
+    """
+    Coalesces embed updates for one message into at most one msg.edit per interval,
+    so a game's progress rows don't queue up behind Discord's edit rate limit.
+    update() never blocks; finish() sends the final state and waits for it.
+    Handlers call cancel() in a finally block so an unexpected error can't leave
+    the background task waiting forever.
+    """
+
+    def __init__(self, msg: discord.Message, interval: float = 0.4) -> None:
+        self._msg = msg
+        self._interval = interval
+        self._embed: Optional[discord.Embed] = None
+        self._dirty = asyncio.Event()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+
+    def update(self, embed: discord.Embed) -> None:
+        self._embed = embed
+        self._dirty.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def finish(self, embed: discord.Embed) -> None:
+        self._closed = True
+        self.update(embed)
+        await self._task
+
+    def cancel(self) -> None:
+        """Stop the background task without sending pending updates; no-op after finish()."""
+        self._closed = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            try:
+                await self._msg.edit(embed=self._embed)
+            except Exception as e:
+                # a failed edit must not kill the task, or later updates would be dropped
+                print(f"[Discord] Failed to edit message: {e}")
+            if self._closed and not self._dirty.is_set():
+                return
+            await asyncio.sleep(self._interval)
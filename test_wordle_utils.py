@@ -0,0 +1,81 @@
+import importlib
+import sys
+
+import pytest
+
+from wordle_utils import (
+    _compute_feedback_unchecked,
+    compute_feedback_batch,
+    compute_wordle_feedback,
+    is_valid_five_letter_word,
+    parse_guess_from_json,
+    pattern_to_code,
+    words_to_u8,
+)
+
+# repeated-letter cases are where feedback implementations tend to disagree
+EQUIVALENCE_WORDS = [
+    "llama", "hello", "babes", "abbey", "eerie", "sassy",
+    "speed", "geese", "crane", "shire", "mamma", "tares",
+]
+
+
+def reference_codes(words):
+    return [[pattern_to_code(compute_wordle_feedback(g, t)) for t in words] for g in words]
+
+
+def test_non_ascii_word_is_not_valid():
+    assert not is_valid_five_letter_word("naïve")
+    assert is_valid_five_letter_word("naive")
+
+
+def test_feedback_rejects_non_ascii_guess():
+    with pytest.raises(ValueError):
+        compute_wordle_feedback("naïve", "hello")
+
+
+def test_parse_rejects_non_ascii_guess():
+    ok, _ = parse_guess_from_json('{"guess":"naïve"}')
+    assert not ok
+
+
+@pytest.mark.parametrize("word", ["naïve", "ÉCLAT", "hell0", "toolong"])
+def test_validating_wrappers_reject_what_the_fast_path_cannot_handle(word):
+    with pytest.raises(ValueError):
+        compute_wordle_feedback(word, "hello")
+    with pytest.raises(ValueError):
+        compute_wordle_feedback("hello", word)
+    with pytest.raises(ValueError):
+        compute_feedback_batch(word, words_to_u8(["hello"]))
+
+
+def test_wrapper_normalizes_before_the_fast_path():
+    assert compute_wordle_feedback(" LLAMA ", "Hello") == _compute_feedback_unchecked("llama", "hello") == "YYBBB"
+
+
+def test_feedback_batch_matches_scalar_feedback():
+    words_u8 = words_to_u8(EQUIVALENCE_WORDS)
+    batch = [compute_feedback_batch(g, words_u8).tolist() for g in EQUIVALENCE_WORDS]
+    assert batch == reference_codes(EQUIVALENCE_WORDS)
+
+
+@pytest.fixture(params=["numba", "fallback"])
+def wordle_fast(request, monkeypatch):
+    """wordle_fast with its Numba kernels, and re-imported with Numba hidden."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        return importlib.import_module("wordle_fast")
+    monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.delitem(sys.modules, "wordle_fast", raising=False)
+    module = importlib.import_module("wordle_fast")
+    assert not module.HAVE_NUMBA
+    return module
+
+
+def test_fast_kernels_match_scalar_feedback(wordle_fast):
+    words_u8 = words_to_u8(EQUIVALENCE_WORDS)
+    expected = reference_codes(EQUIVALENCE_WORDS)
+    assert wordle_fast.feedback_code_matrix(words_u8, words_u8).tolist() == expected
+    for i, g in enumerate(words_u8):
+        assert wordle_fast.feedback_code_batch(g, words_u8).tolist() == expected[i]
+        assert [wordle_fast.feedback_code(g, t) for t in words_u8] == expected[i]
@@ -1,19 +1,39 @@
-from typing import List, Tuple, Optional, Set, Dict
+from typing import List, Tuple, Optional, Set
+import asyncio
+import functools
+import hashlib
 import os
+import tempfile
+import threading
+import numpy as np
 import discord
 from discord import app_commands
 
+from discord_utils import EmbedStreamer
 from wordle_utils import (
-    compute_wordle_feedback,
+    _compute_feedback_unchecked,
+    pattern_to_code,
     pattern_to_emojis,
-    get_today_wordle_solution,
+    words_to_u8,
+    get_today_wordle_solution_async,
     normalize_word,
     is_valid_five_letter_word,
 )
+from wordle_fast import feedback_code_matrix
 
 WORDS_PATH = os.environ.get("WORDLE_WORDS_PATH", "./data/valid_wordle_words.txt")
+CODES_DIR = os.environ.get("WORDLE_CODES_DIR", "./data")
 
-def load_word_list() -> List[str]:
+# number of distinct feedback codes (3 ** 5)
+N_CODES = 243
+
+# lru_cache doesn't make concurrent callers wait for one computation, so the
+# expensive one-time loads below are serialized (re-entrant: the opener loads the codes)
+_build_lock = threading.RLock()
+
+@functools.lru_cache(maxsize=1)
+def load_word_list() -> Tuple[str, ...]:
+    """Read, clean and sort the word list once; later calls return the same tuple."""
     words: List[str] = []
     try:
         with open(WORDS_PATH, "r", encoding="utf-8") as f:
@@ -28,42 +48,168 @@ def load_word_list() -> List[str]:
     clean = sorted({w for w in words if is_valid_five_letter_word(w)})
     if not clean:
         raise RuntimeError("Word list was empty or invalid after cleaning.")
-    return clean
-
-def build_letter_freq(remaining: List[str]) -> Dict[str, int]:
-    """Count how many candidate words contain each letter at least once."""
-    freq: Dict[str, int] = {}
-    for w in remaining:
-        if not isinstance(w, str) or not is_valid_five_letter_word(w):
-            # Skip anything unexpected
-            continue
-        for ch in set(w):  # unique letters per word
-            freq[ch] = freq.get(ch, 0) + 1
-    return freq
-
-def score_word(word: str, freq: Dict[str, int]) -> int:
-    """Sum of letter frequencies for UNIQUE letters in the word."""
-    # word is guaranteed to be clean by callers
-    return sum(freq.get(ch, 0) for ch in set(word))
-
-def best_next_guess(remaining: List[str], tried: Set[str]) -> str:
-    """Pick the highest scoring (unique-letters) word among remaining."""
-    # Always recompute freq from current remaining set
-    freq = build_letter_freq(remaining)
-
-    candidates = [w for w in remaining if w not in tried and is_valid_five_letter_word(w)]
-    if not candidates:
-        # Fallback if everything got tried somehow
-        candidates = [w for w in remaining if is_valid_five_letter_word(w)]
-        if not candidates:
-            # Should never happen, but guard anyway
-            raise RuntimeError("No valid candidates available.")
+    return tuple(clean)
+
+@functools.lru_cache(maxsize=1)
+def load_words_u8() -> np.ndarray:
+    """load_word_list packed by words_to_u8; read-only and row-aligned with it."""
+    words_u8 = words_to_u8(list(load_word_list()))
+    words_u8.flags.writeable = False
+    return words_u8
+
+@functools.lru_cache(maxsize=1)
+def load_letter_masks() -> np.ndarray:
+    """26-bit mask of the letters in each word (bit k = chr(97 + k)), row-aligned with load_word_list."""
+    bits = np.left_shift(np.uint32(1), load_words_u8().astype(np.uint32))
+    masks = np.bitwise_or.reduce(bits, axis=1)
+    masks.flags.writeable = False
+    return masks
+
+@functools.lru_cache(maxsize=1)
+def load_letter_bits() -> np.ndarray:
+    """load_letter_masks unpacked to a (W, 26) uint8 matrix: BITS[i, k] = letter k is in word i."""
+    bits = ((load_letter_masks()[:, None] >> np.arange(26, dtype=np.uint32)) & 1).astype(np.uint8)
+    bits.flags.writeable = False
+    return bits
+
+@functools.lru_cache(maxsize=1)
+def load_unique_counts() -> np.ndarray:
+    """Number of distinct letters in each word (popcount of load_letter_masks)."""
+    unique = load_letter_bits().sum(axis=1, dtype=np.uint8)
+    unique.flags.writeable = False
+    return unique
+
+def build_letter_freq(remaining_idx: np.ndarray) -> np.ndarray:
+    """Count how many candidate words contain each letter at least once (index k = chr(97 + k))."""
+    return load_letter_bits()[remaining_idx].sum(axis=0, dtype=np.int64)
+
+def score_words(word_idx: np.ndarray, freq: np.ndarray) -> np.ndarray:
+    """Sum of letter frequencies for UNIQUE letters in each word."""
+    return load_letter_bits()[word_idx] @ freq
+
+def load_feedback_codes() -> np.ndarray:
+    """
+    CODES[g, t] = packed feedback code (see pattern_to_code) of word_list[g]
+    guessed against word_list[t]. Built once per process, or read from the .npy
+    cache in CODES_DIR keyed by a hash of the word list.
+    """
+    with _build_lock:
+        return _load_feedback_codes()
+
+@functools.lru_cache(maxsize=1)
+def _load_feedback_codes() -> np.ndarray:
+    word_list = load_word_list()
+    key = hashlib.sha256("\n".join(word_list).encode("ascii")).hexdigest()[:16]
+
+    n = len(word_list)
+    path = os.path.join(CODES_DIR, f"feedback_codes_{key}.npy")
+    codes: Optional[np.ndarray] = None
+    try:
+        # memory-mapped: the OS page cache holds one copy, not one per process
+        codes = np.load(path, mmap_mode="r")
+        if codes.shape != (n, n) or codes.dtype != np.uint8:
+            print(f"[CSP] Ignoring feedback code cache {path}: unexpected shape {codes.shape}")
+            codes = None
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"[CSP] Ignoring feedback code cache {path}: {e}")
+
+    if codes is None:
+        print(f"[CSP] Building feedback codes for {n} words...")
+        words_u8 = load_words_u8()
+        codes = feedback_code_matrix(words_u8, words_u8)
+        save_codes_cache(codes, path)
+
+    codes.flags.writeable = False
+    return codes
+
+def save_codes_cache(codes: np.ndarray, path: str) -> None:
+    """Write codes to path atomically via a uniquely named temp file in the same directory."""
+    tmp: Optional[str] = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path) or ".", suffix=".npy.tmp", delete=False
+        ) as f:
+            tmp = f.name
+            np.save(f, codes)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[CSP] Could not write feedback code cache {path}: {e}")
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+def partition_counts(codes: np.ndarray, remaining_idx: np.ndarray, chunk: int = 512) -> np.ndarray:
+    """
+    counts[g, c] = how many remaining candidates give feedback code c for guess g.
+    Guesses are processed in row blocks so the temporary stays small.
+    """
+    n_guesses = codes.shape[0]
+    counts = np.empty((n_guesses, N_CODES), dtype=np.int32)
+    for start in range(0, n_guesses, chunk):
+        block = codes[start:start + chunk][:, remaining_idx].astype(np.int32)
+        rows = block.shape[0]
+        block += (np.arange(rows, dtype=np.int32) * N_CODES)[:, None]
+        counts[start:start + rows] = np.bincount(
+            block.ravel(), minlength=rows * N_CODES
+        ).reshape(rows, N_CODES)
+    return counts
+
+def guess_entropy(codes: np.ndarray, remaining_idx: np.ndarray) -> np.ndarray:
+    """Entropy (bits) of every guess's feedback partition of the remaining candidates."""
+    # H = log2(n) - sum(c * log2(c)) / n over partition sizes c (0 * log 0 = 0)
+    counts = partition_counts(codes, remaining_idx).astype(np.float64)
+    n = float(remaining_idx.size)
+    return np.log2(n) - (counts * np.log2(np.maximum(counts, 1.0))).sum(axis=1) / n
+
+def load_opening_entropy() -> np.ndarray:
+    """
+    guess_entropy over the whole word list. Every game starts from that list, and
+    scoring it takes seconds, so it is computed once per process.
+    """
+    with _build_lock:
+        return _load_opening_entropy()
+
+@functools.lru_cache(maxsize=1)
+def _load_opening_entropy() -> np.ndarray:
+    codes = load_feedback_codes()
+    entropy = guess_entropy(codes, np.arange(codes.shape[1], dtype=np.int32))
+    entropy.flags.writeable = False
+    return entropy
+
+def best_next_guess(
+    codes: np.ndarray,
+    remaining_idx: np.ndarray,
+    tried: Set[int],
+) -> int:
+    """
+    Pick the guess (index into load_word_list()) with the highest expected information,
+    i.e. the entropy of its feedback partition of the remaining candidates. Ties
+    prefer words that can still be the answer, then the unique-letter frequency score.
+    codes must be load_feedback_codes(); the full-list scores come from its cache.
+    """
+    if remaining_idx.size == 0:
+        # Should never happen, but guard anyway
+        raise RuntimeError("No valid candidates available.")
+
+    if remaining_idx.size == codes.shape[1]:
+        # nothing filtered yet (the opener): reuse the cached scores
+        entropy = load_opening_entropy()
+    else:
+        entropy = guess_entropy(codes, remaining_idx)
+    if tried:
+        entropy = entropy.copy()
+        entropy[list(tried)] = -np.inf
+
+    tied = np.flatnonzero(entropy >= entropy.max() - 1e-9)
+    possible = tied[np.isin(tied, remaining_idx)]
+    if possible.size:
+        tied = possible
 
     # Prefer words with higher score, then more unique letters, then lexicographic for stability
-    return max(
-        candidates,
-        key=lambda w: (score_word(w, freq), len(set(w)), w),
-    )
+    # (the word list is sorted, so the last maximum is the lexicographically largest word)
+    keys = score_words(tied, build_letter_freq(remaining_idx)) * 256 + load_unique_counts()[tied]
+    return int(tied[tied.size - 1 - np.argmax(keys[::-1])])
 
 def register(tree: app_commands.CommandTree) -> None:
     @tree.command(
@@ -81,69 +227,94 @@ def register(tree: app_commands.CommandTree) -> None:
         )
         await interaction.response.send_message(embed=embed)
         msg = await interaction.original_response()
-
-        solution = get_today_wordle_solution()
-        if not solution:
-            embed.title = "Wordle error"
-            embed.description = "Could not fetch today's Wordle."
-            embed.color = discord.Color.red()
-            await msg.edit(embed=embed)
-            return
-
+        streamer = EmbedStreamer(msg)
         try:
-            word_list = load_word_list()
-        except Exception as e:
-            embed.title = "Word list error"
-            embed.description = str(e)
-            embed.color = discord.Color.red()
-            await msg.edit(embed=embed)
-            return
+            solution = await get_today_wordle_solution_async()
+            if not solution:
+                embed.title = "Wordle error"
+                embed.description = "Could not fetch today's Wordle."
+                embed.color = discord.Color.red()
+                await streamer.finish(embed)
+                return
 
-        remaining: List[str] = word_list.copy()
-        tried: Set[str] = set()
-        feedback_rows: List[str] = []
-        guess_count: Optional[int] = None
+            try:
+                word_list = load_word_list()
+            except Exception as e:
+                embed.title = "Word list error"
+                embed.description = str(e)
+                embed.color = discord.Color.red()
+                await streamer.finish(embed)
+                return
 
-        for attempt in range(1, 7):
             try:
-                guess = best_next_guess(remaining, tried)
+                # first use builds a large matrix; keep the event loop responsive
+                codes = await asyncio.to_thread(load_feedback_codes)
             except Exception as e:
                 embed.title = "Solver error"
-                embed.description = f"Failed to choose next guess.\n{e}"
+                embed.description = f"Failed to build feedback codes.\n{e}"
                 embed.color = discord.Color.red()
-                await msg.edit(embed=embed)
+                await streamer.finish(embed)
                 return
 
-            tried.add(guess)
-            pattern = compute_wordle_feedback(guess, solution)
+            # candidates are tracked as indices into word_list
+            remaining_idx = np.arange(len(word_list), dtype=np.int32)
+            tried: Set[int] = set()
+            feedback_rows: List[str] = []
+            guess_count: Optional[int] = None
 
-            # Console
-            print(
-                f"[CSP Attempt {attempt}] Guess: {guess.upper()} | "
-                f"Feedback: {pattern} | Correct: {'✅' if guess == solution else '❌'}"
-            )
+            for attempt in range(1, 7):
+                try:
+                    guess_idx = await asyncio.to_thread(
+                        best_next_guess, codes, remaining_idx, tried
+                    )
+                except Exception as e:
+                    embed.title = "Solver error"
+                    embed.description = f"Failed to choose next guess.\n{e}"
+                    embed.color = discord.Color.red()
+                    await streamer.finish(embed)
+                    return
 
-            # Discord
-            feedback_rows.append(pattern_to_emojis(pattern))
-            embed.description = "\n".join(feedback_rows)
-            await msg.edit(embed=embed)
+                tried.add(guess_idx)
+                guess = word_list[guess_idx]
+                # guess comes from the cleaned word list and solution is normalized on fetch
+                pattern = _compute_feedback_unchecked(guess, solution)
 
-            if pattern == "GGGGG":
-                guess_count = attempt
-                break
+                # Console
+                print(
+                    f"[CSP Attempt {attempt}] Guess: {guess.upper()} | "
+                    f"Feedback: {pattern} | Correct: {'✅' if guess == solution else '❌'}"
+                )
 
-            # filter: keep only words consistent with observed pattern
-            new_remaining = [c for c in remaining if compute_wordle_feedback(guess, c) == pattern]
-            remaining = new_remaining if new_remaining else remaining  # conservative fallback
+                # Discord
+                feedback_rows.append(pattern_to_emojis(pattern))
+                embed.description = "\n".join(feedback_rows)
+                streamer.update(embed)
 
-        # finalize
-        if guess_count is None:
-            footer_line = "Solver failed to solve today's Wordle in 6 guesses."
-            embed.color = discord.Color.red()
-        else:
-            footer_line = f"Solved in {guess_count} guesses."
-            embed.color = discord.Color.blue()
+                if pattern == "GGGGG":
+                    guess_count = attempt
+                    break
 
-        embed.title = "Solver result"
-        embed.description = "\n".join(feedback_rows + ["", footer_line]) if feedback_rows else footer_line
-        await msg.edit(embed=embed)
+                # filter: keep only words consistent with observed pattern
+                new_idx = remaining_idx[codes[guess_idx, remaining_idx] == pattern_to_code(pattern)]
+                remaining_idx = new_idx if new_idx.size else remaining_idx  # conservative fallback
+
+            # finalize
+            if guess_count is None:
+                footer_line = "Solver failed to solve today's Wordle in 6 guesses."
+                embed.color = discord.Color.red()
+            else:
+                footer_line = f"Solved in {guess_count} guesses."
+                embed.color = discord.Color.blue()
+
+            embed.title = "Solver result"
+            embed.description = "\n".join(feedback_rows + ["", footer_line]) if feedback_rows else footer_line
+            await streamer.finish(embed)
+        except Exception as e:
+            # make sure the message still shows a final state, then let discord.py log it
+            embed.title = "Solver error"
+            embed.description = f"Unexpected error.\n{e}"
+            embed.color = discord.Color.red()
+            await streamer.finish(embed)
+            raise
+        finally:
+            streamer.cancel()
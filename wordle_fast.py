@@ -0,0 +1,77 @@
+import numpy as np
+
+from wordle_utils import (
+    _compute_feedback_unchecked,
+    feedback_batch_u8,
+    pattern_to_code,
+)
+
+# Numba is optional; without it we fall back to the NumPy / pure-Python helpers
+try:
+    from numba import njit, prange
+except Exception:
+    njit = None  # type: ignore
+
+HAVE_NUMBA = njit is not None
+
+
+def _u8_to_word(word_u8: np.ndarray) -> str:
+    return "".join(chr(int(c) + 97) for c in word_u8)
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, boundscheck=False)
+    def feedback_code(guess_u8: np.ndarray, target_u8: np.ndarray) -> int:
+        """Packed feedback code (see pattern_to_code) of one guess against one target."""
+        counts = np.zeros(26, np.int8)
+        for i in range(5):
+            if guess_u8[i] != target_u8[i]:
+                counts[target_u8[i]] += 1
+
+        code = 0
+        weight = 1
+        for i in range(5):
+            ch = guess_u8[i]
+            if ch == target_u8[i]:
+                code += 2 * weight
+            elif counts[ch] > 0:
+                code += weight
+                counts[ch] -= 1
+            weight *= 3
+        return code
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def feedback_code_batch(guess_u8: np.ndarray, targets_u8: np.ndarray) -> np.ndarray:
+        """feedback_code of one guess against every row of targets_u8."""
+        n = targets_u8.shape[0]
+        out = np.empty(n, np.uint8)
+        for t in prange(n):
+            out[t] = feedback_code(guess_u8, targets_u8[t])
+        return out
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def feedback_code_matrix(guesses_u8: np.ndarray, targets_u8: np.ndarray) -> np.ndarray:
+        """out[g, t] = feedback_code(guesses_u8[g], targets_u8[t])."""
+        n_guesses = guesses_u8.shape[0]
+        n_targets = targets_u8.shape[0]
+        out = np.empty((n_guesses, n_targets), np.uint8)
+        for g in prange(n_guesses):
+            for t in range(n_targets):
+                out[g, t] = feedback_code(guesses_u8[g], targets_u8[t])
+        return out
+
+else:
+    def feedback_code(guess_u8: np.ndarray, target_u8: np.ndarray) -> int:
+        """Packed feedback code (see pattern_to_code) of one guess against one target."""
+        return pattern_to_code(_compute_feedback_unchecked(_u8_to_word(guess_u8), _u8_to_word(target_u8)))
+
+    def feedback_code_batch(guess_u8: np.ndarray, targets_u8: np.ndarray) -> np.ndarray:
+        """feedback_code of one guess against every row of targets_u8."""
+        return feedback_batch_u8(guess_u8, targets_u8)
+
+    def feedback_code_matrix(guesses_u8: np.ndarray, targets_u8: np.ndarray) -> np.ndarray:
+        """out[g, t] = feedback_code(guesses_u8[g], targets_u8[t])."""
+        out = np.empty((guesses_u8.shape[0], targets_u8.shape[0]), dtype=np.uint8)
+        for g in range(guesses_u8.shape[0]):
+            out[g] = feedback_batch_u8(guesses_u8[g], targets_u8)
+        return out
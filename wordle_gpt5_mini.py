@@ -1,34 +1,187 @@
 from typing import List, Any, Optional, Dict
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import discord
 from discord import app_commands
 
+from discord_utils import EmbedStreamer
 from wordle_utils import (
     compute_wordle_feedback,
     pattern_to_emojis,
     parse_guess_from_json,
-    get_today_wordle_solution,
+    get_today_wordle_solution_async,
+    normalize_word,
+    is_valid_five_letter_word,
 )
 
 # Import OpenAI SDK, but do not create a client at import time
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 except Exception:
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+    DefaultAsyncHttpxClient = None  # type: ignore
+
+# Response cache is optional; without diskcache every call goes to the API
+try:
+    import diskcache
+except Exception:
+    diskcache = None  # type: ignore
+
+MODEL = "gpt-5-mini"
+# Turn 1 has no feedback to work from, so it is played without a model call
+DEFAULT_OPENER = "salet"
+OPENAI_CACHE_DIR = os.environ.get("OPENAI_CACHE_DIR", "./data/openai_cache")
+# entries are salted with the day's solution, so they are only useful for a day or so
+OPENAI_CACHE_TTL = 2 * 24 * 60 * 60
+
+# one client for the whole process so games reuse its HTTP/2 connection
+_client: Optional[Any] = None
+_cache: Optional[Any] = None
 
 
 def get_client() -> Any:
     """
-    Create the OpenAI client so .env has already been loaded by main.py.
+    Create the shared OpenAI client on first use so .env has already been loaded by main.py.
     Raises a clear error if the key or SDK is missing.
     """
-    if OpenAI is None:
-        raise RuntimeError("openai package not installed. Run: pip install openai")
-    if not os.environ.get("OPENAI_API_KEY"):
-        raise RuntimeError("OPENAI_API_KEY not found in environment.")
-    return OpenAI()
+    global _client
+    if _client is None:
+        if AsyncOpenAI is None:
+            raise RuntimeError("openai package not installed. Run: pip install openai")
+        if not os.environ.get("OPENAI_API_KEY"):
+            raise RuntimeError("OPENAI_API_KEY not found in environment.")
+        _client = AsyncOpenAI(http_client=DefaultAsyncHttpxClient(http2=True))
+    return _client
+
+
+def get_cache() -> Optional[Any]:
+    """Open the on-disk response cache on first use; None if diskcache is not installed."""
+    global _cache
+    if _cache is None and diskcache is not None:
+        _cache = diskcache.Cache(OPENAI_CACHE_DIR)
+    return _cache
+
+
+async def complete_json(client: Any, messages: List[Dict[str, str]], solution: str) -> str:
+    """
+    One JSON-mode completion. Replies are cached on disk by model, the day's
+    solution and the exact messages, so replaying the same guess path is free.
+    """
+    key = hashlib.sha256(
+        json.dumps({"model": MODEL, "solution": solution, "messages": messages}, sort_keys=True).encode()
+    ).hexdigest()
+    # diskcache does blocking SQLite I/O, so keep it off the event loop. The cache is
+    # only an optimization: any failure (read-only/full disk, lock timeout) falls through to the API.
+    cache: Optional[Any] = None
+    try:
+        cache = await asyncio.to_thread(get_cache)
+        if cache is not None:
+            content = await asyncio.to_thread(cache.get, key)
+            if content is not None:
+                return content
+    except Exception as e:
+        print(f"[GPT5] Response cache read failed: {e}")
+
+    # Do not set temperature for gpt-5-mini.
+    resp = await client.chat.completions.create(
+        model=MODEL,
+        response_format={"type": "json_object"},
+        messages=messages,
+    )
+    content = resp.choices[0].message.content or ""
+    if cache is not None and content:
+        try:
+            await asyncio.to_thread(cache.set, key, content, expire=OPENAI_CACHE_TTL)
+        except Exception as e:
+            print(f"[GPT5] Response cache write failed: {e}")
+    return content
+
+
+# Stable reference text appended to the system prompt. OpenAI only caches prompt
+# prefixes of 1024+ tokens, so this keeps the system message over that threshold and
+# turns 2-6 of a game reuse the cached prefix. Edit rarely: any change invalidates it.
+# Measured with tiktoken o200k_base: this block is 1270 tokens and the full system
+# prompt 1381 (111 without it). Re-measure after edits; it must stay above 1024.
+WORDLE_REFERENCE = (
+    "\n"
+    "Reference: rules of the game\n"
+    "- The secret word and every guess are exactly five letters, a to z, lowercase.\n"
+    "- The game allows six guesses. A guess whose feedback is GGGGG wins.\n"
+    "- Feedback is a string of five characters, one per position of your guess, left to right.\n"
+    "- G means the letter is in the secret at exactly that position.\n"
+    "- Y means the letter is in the secret, but not at that position.\n"
+    "- B means the letter does not appear in the secret any more times than already marked.\n"
+    "\n"
+    "Reference: repeated letters\n"
+    "- Greens are assigned first. Then each remaining guess letter, from left to right, is\n"
+    "  marked Y only while unmatched copies of that letter remain in the secret.\n"
+    "- So if you guess a letter twice and the secret has it once, one copy is G or Y and the\n"
+    "  other is B. The B on the second copy does NOT mean the letter is absent.\n"
+    "- If a letter is marked B and never G or Y in the same guess, it is absent from the secret.\n"
+    "- If a letter is marked G or Y and also B in the same guess, the secret has exactly as many\n"
+    "  copies of it as there were G and Y marks for it.\n"
+    "- Secrets can contain repeated letters (for example: eerie, llama, mamma, geese, sassy).\n"
+    "\n"
+    "Reference: how to use feedback\n"
+    "- Keep every G letter fixed in its position in all later guesses.\n"
+    "- Every Y letter must appear in later guesses, but never again at a position where it was Y.\n"
+    "- Never use an absent letter again unless you are deliberately probing other letters.\n"
+    "- Combine all feedback so far: a candidate must be consistent with every previous guess.\n"
+    "- Before answering, check your candidate against each earlier guess and its feedback as if\n"
+    "  it were the secret. If any position would score differently, pick another word.\n"
+    "\n"
+    "Reference: strategy\n"
+    "- Early guesses should test many common letters: e, a, r, o, t, l, i, s, n, c, u, y.\n"
+    "- Strong openers include: salet, slate, crane, trace, crate, carte, tares, raise, arise,\n"
+    "  stare, roate, irate, soare, later, alert, alter, least, steal, react, slant, trice.\n"
+    "- Good follow-ups after a weak opener cover fresh letters, e.g. pound, minty, cloud, dough.\n"
+    "- With many candidates left, prefer a guess that splits them into many small groups, even if\n"
+    "  it cannot be the answer. With two or three candidates left, guess one of them.\n"
+    "- Common endings to consider: -er, -ed, -es, -ly, -ch, -sh, -ck, -ng, -ty, -ny, -ay.\n"
+    "- Common beginnings to consider: st-, sh-, ch-, cr-, br-, tr-, gr-, pl-, sl-, sp-, bl-, fl-.\n"
+    "- Watch for letter families that trap solvers: _ight, _ound, _atch, _ower, _aste, _ill_.\n"
+    "  When several words differ in one slot, use a guess that tests several of those letters.\n"
+    "- Prefer common English words for the answer; the secret is rarely an obscure word.\n"
+    "\n"
+    "Reference: letter frequency in five-letter answers, most to least common\n"
+    "- e, a, r, o, t, l, i, s, n, c, u, y, d, h, p, m, g, b, f, k, w, v, z, x, q, j.\n"
+    "- Vowels: most answers have one or two; y often acts as a vowel at the end (fuzzy, party).\n"
+    "- Letters that often repeat: e, o, l, s, t, r, p, f, d, n (sleep, floor, shell, stuff).\n"
+    "- Letters usually at the start: s, c, b, t, p, a, f, g, d, m, r, l, w, h.\n"
+    "- Letters usually at the end: e, y, t, r, l, h, n, d, k, a, o, s (s is rare as a plural).\n"
+    "- q is almost always followed by u; j, x and z appear in few answers and rarely twice.\n"
+    "\n"
+    "Reference: narrowing checklist for each new guess\n"
+    "1. List the fixed letters from G marks and place them.\n"
+    "2. List the required letters from Y marks and the positions each one cannot take.\n"
+    "3. List the excluded letters from B marks, minding the repeated-letter rule above.\n"
+    "4. Think of common words that satisfy all three lists at once.\n"
+    "5. If more than two such words remain and guesses are left, consider a probing word\n"
+    "   that tests the letters that separate them; otherwise guess the most common one.\n"
+    "6. Make sure the word was not guessed before in this game.\n"
+    "\n"
+    "Reference: output format\n"
+    '- Reply with a single JSON object and nothing else, for example {"guess":"crane"}.\n'
+    "- The value must be one real five-letter English word in lowercase with no spaces.\n"
+    "- Do not wrap the JSON in code fences, do not add keys, and do not explain the guess.\n"
+    "- If a message says your previous reply was invalid or repeated, reply with a different\n"
+    "  valid word in the same JSON shape right away.\n"
+    "\n"
+    "Reference: worked example\n"
+    "- Secret: shire. Guess: slate. Feedback: GBBBG (s and e are correct; l, a, t absent).\n"
+    "- Next guess: shine. Feedback: GGGBG (n is absent).\n"
+    "- Next guess: shire. Feedback: GGGGG. Solved in three.\n"
+    "- Secret: hello. Guess: llama. Feedback: YYBBB. The first l is Y and the second l is Y\n"
+    "  as well, because the secret has two copies of l, neither at positions 1 or 2.\n"
+    "- Secret: abbey. Guess: babes. Feedback: YYGGB. b at position 3 is G, the other b is Y,\n"
+    "  a is Y, e is G, s is absent.\n"
+)
 
 
+@functools.lru_cache(maxsize=1)
 def build_system_prompt() -> str:
     return (
         "You are an expert Wordle assistant.\n"
@@ -39,6 +192,7 @@ def build_system_prompt() -> str:
         "- Do not reveal reasoning. Do not add commentary.\n"
         '- Output ONLY JSON with the exact shape {"guess":"abcde"} in lowercase.\n'
         "- Never repeat a previous guess. If told a guess was invalid or repeated, immediately propose a new one."
+        + WORDLE_REFERENCE
     )
 
 
@@ -59,135 +213,143 @@ def register(tree: app_commands.CommandTree) -> None:
         )
         await interaction.response.send_message(embed=embed)
         msg = await interaction.original_response()
-
-        # Resolve today's answer
-        solution = get_today_wordle_solution()
-        if not solution:
-            embed.title = "Wordle error"
-            embed.description = "Could not fetch today's Wordle."
-            embed.color = discord.Color.red()
-            await msg.edit(embed=embed)
-            return
-
-        # Create client lazily so env is loaded by main.py
+        streamer = EmbedStreamer(msg)
         try:
-            oa_client = get_client()
-        except Exception as e:
-            embed.title = "OpenAI error"
-            embed.description = str(e)
-            embed.color = discord.Color.red()
-            await msg.edit(embed=embed)
-            return
-
-        system_prompt = build_system_prompt()
-        messages: List[Dict[str, str]] = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": 'New game. Respond ONLY with JSON {"guess":"abcde"}. Provide your first guess.'},
-        ]
-
-        guessed_words: List[str] = []
-        feedback_rows: List[str] = []
-        guess_count: Optional[int] = None
+            # Resolve today's answer
+            solution = await get_today_wordle_solution_async()
+            if not solution:
+                embed.title = "Wordle error"
+                embed.description = "Could not fetch today's Wordle."
+                embed.color = discord.Color.red()
+                await streamer.finish(embed)
+                return
 
-        for attempt in range(1, 7):
-            # Model call with JSON-only response. Do not set temperature for gpt-5-mini.
+            # Shared client is created lazily so env is loaded by main.py
             try:
-                resp = oa_client.chat.completions.create(
-                    model="gpt-5-mini",
-                    response_format={"type": "json_object"},
-                    messages=messages,
-                )
-                content: str = resp.choices[0].message.content or ""
+                oa_client = get_client()
             except Exception as e:
-                embed.title = "OpenAI API error"
-                embed.description = f"API call failed.\n\n{e}"
+                embed.title = "OpenAI error"
+                embed.description = str(e)
                 embed.color = discord.Color.red()
-                await msg.edit(embed=embed)
+                await streamer.finish(embed)
                 return
 
-            ok, guess_or_err = parse_guess_from_json(content)
-            if not ok:
-                # Ask the model to fix format without burning the attempt
-                messages.append({
-                    "role": "user",
-                    "content": (
-                        f"Invalid response. {guess_or_err} "
-                        'Output exactly: {"guess":"abcde"} with a single 5-letter lowercase word.'
-                    ),
-                })
-                # Quick retry
-                try:
-                    resp = oa_client.chat.completions.create(
-                        model="gpt-5-mini",
-                        response_format={"type": "json_object"},
-                        messages=messages,
-                    )
-                    content = resp.choices[0].message.content or ""
-                except Exception as e:
-                    embed.title = "OpenAI API error"
-                    embed.description = f"API call failed.\n\n{e}"
-                    embed.color = discord.Color.red()
-                    await msg.edit(embed=embed)
-                    return
+            system_prompt = build_system_prompt()
+            messages: List[Dict[str, str]] = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": 'New game. Respond ONLY with JSON {"guess":"abcde"}. Provide your first guess.'},
+            ]
+
+            # Read here rather than at import so .env has been loaded; invalid values fall back to the model
+            opener = normalize_word(os.environ.get("WORDLE_OPENER", DEFAULT_OPENER))
+
+            guessed_words: List[str] = []
+            feedback_rows: List[str] = []
+            guess_count: Optional[int] = None
+
+            for attempt in range(1, 7):
+                if attempt == 1 and is_valid_five_letter_word(opener):
+                    # Play the fixed opener as if the model had answered with it
+                    content: str = json.dumps({"guess": opener})
+                    messages.append({"role": "assistant", "content": content})
+                else:
+                    # Model call with JSON-only response
+                    try:
+                        content = await complete_json(oa_client, messages, solution)
+                    except Exception as e:
+                        embed.title = "OpenAI API error"
+                        embed.description = f"API call failed.\n\n{e}"
+                        embed.color = discord.Color.red()
+                        await streamer.finish(embed)
+                        return
 
                 ok, guess_or_err = parse_guess_from_json(content)
                 if not ok:
-                    embed.title = "ChatGPT result"
-                    embed.description = "\n".join(feedback_rows + ["ChatGPT failed to produce a valid guess."])
-                    embed.color = discord.Color.red()
-                    await msg.edit(embed=embed)
-                    return
+                    # Ask the model to fix format without burning the attempt
+                    messages.append({
+                        "role": "user",
+                        "content": (
+                            f"Invalid response. {guess_or_err} "
+                            'Output exactly: {"guess":"abcde"} with a single 5-letter lowercase word.'
+                        ),
+                    })
+                    # Quick retry
+                    try:
+                        content = await complete_json(oa_client, messages, solution)
+                    except Exception as e:
+                        embed.title = "OpenAI API error"
+                        embed.description = f"API call failed.\n\n{e}"
+                        embed.color = discord.Color.red()
+                        await streamer.finish(embed)
+                        return
 
-            guess: str = guess_or_err
+                    ok, guess_or_err = parse_guess_from_json(content)
+                    if not ok:
+                        embed.title = "ChatGPT result"
+                        embed.description = "\n".join(feedback_rows + ["ChatGPT failed to produce a valid guess."])
+                        embed.color = discord.Color.red()
+                        await streamer.finish(embed)
+                        return
 
-            # Prevent repeats without burning attempt
-            if guess in guessed_words:
+                guess: str = guess_or_err
+
+                # Prevent repeats without burning attempt
+                if guess in guessed_words:
+                    messages.append({
+                        "role": "user",
+                        "content": (
+                            f"The guess '{guess}' was already tried. Do not repeat guesses. "
+                            'Return a new JSON guess now.'
+                        ),
+                    })
+                    # Ask again on the same attempt index
+                    continue
+
+                guessed_words.append(guess)
+                pattern = compute_wordle_feedback(guess, solution)
+
+                # Console logging with full detail for debugging
+                print(
+                    f"[GPT5 Attempt {attempt}] Guess: {guess.upper()} | "
+                    f"Feedback: {pattern} | Correct: {'✅' if guess == solution else '❌'}"
+                )
+
+                # Discord feedback as emoji only
+                feedback_rows.append(pattern_to_emojis(pattern))
+                embed.description = "\n".join(feedback_rows)
+                streamer.update(embed)
+
+                if pattern == "GGGGG":
+                    guess_count = attempt
+                    break
+
+                # Provide structured feedback back to the model
                 messages.append({
                     "role": "user",
                     "content": (
-                        f"The guess '{guess}' was already tried. Do not repeat guesses. "
-                        'Return a new JSON guess now.'
+                        f"Feedback for guess '{guess}': {pattern}. "
+                        "Legend: G=correct place, Y=wrong place, B=absent. "
+                        'Respond ONLY with JSON {"guess":"abcde"}.'
                     ),
                 })
-                # Ask again on the same attempt index
-                continue
-
-            guessed_words.append(guess)
-            pattern = compute_wordle_feedback(guess, solution)
-
-            # Console logging with full detail for debugging
-            print(
-                f"[GPT5 Attempt {attempt}] Guess: {guess.upper()} | "
-                f"Feedback: {pattern} | Correct: {'✅' if guess == solution else '❌'}"
-            )
-
-            # Discord feedback as emoji only
-            feedback_rows.append(pattern_to_emojis(pattern))
-            embed.description = "\n".join(feedback_rows)
-            await msg.edit(embed=embed)
-
-            if pattern == "GGGGG":
-                guess_count = attempt
-                break
-
-            # Provide structured feedback back to the model
-            messages.append({
-                "role": "user",
-                "content": (
-                    f"Feedback for guess '{guess}': {pattern}. "
-                    "Legend: G=correct place, Y=wrong place, B=absent. "
-                    'Respond ONLY with JSON {"guess":"abcde"}.'
-                ),
-            })
-
-        # Finalize
-        if guess_count is None:
-            footer_line = "ChatGPT failed to solve today's Wordle in 6 guesses."
-            embed.color = discord.Color.red()
-        else:
-            footer_line = f"Solved in {guess_count} guesses."
-            embed.color = discord.Color.blue()
 
-        embed.title = "ChatGPT result"
-        embed.description = "\n".join(feedback_rows + ["", footer_line]) if feedback_rows else footer_line
-        await msg.edit(embed=embed)
+            # Finalize
+            if guess_count is None:
+                footer_line = "ChatGPT failed to solve today's Wordle in 6 guesses."
+                embed.color = discord.Color.red()
+            else:
+                footer_line = f"Solved in {guess_count} guesses."
+                embed.color = discord.Color.blue()
+
+            embed.title = "ChatGPT result"
+            embed.description = "\n".join(feedback_rows + ["", footer_line]) if feedback_rows else footer_line
+            await streamer.finish(embed)
+        except Exception as e:
+            # make sure the message still shows a final state, then let discord.py log it
+            embed.title = "ChatGPT error"
+            embed.description = f"Unexpected error.\n{e}"
+            embed.color = discord.Color.red()
+            await streamer.finish(embed)
+            raise
+        finally:
+            streamer.cancel()
@@ -1,13 +1,22 @@
 from typing import List, Optional, Tuple, Dict, Any
 from zoneinfo import ZoneInfo
+import asyncio
 import datetime
-import requests
-import json
+import functools
+import aiohttp
+import numpy as np
+
+# orjson is optional; it parses the small model replies faster than the stdlib
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore
 
 # ---------- core wordle helpers ----------
 
 def is_valid_five_letter_word(word: str) -> bool:
-    return isinstance(word, str) and len(word) == 5 and word.isalpha()
+    # ASCII only: str.isalpha() alone also accepts letters like "ï", which the a-z helpers can't index
+    return isinstance(word, str) and len(word) == 5 and word.isascii() and word.isalpha()
 
 def normalize_word(word: str) -> str:
     return word.strip().lower()
@@ -17,41 +26,103 @@ def compute_wordle_feedback(guess: str, target: str) -> str:
     G = green (correct letter & position)
     Y = yellow (in word, wrong position)
     B = black/absent
+    Validating wrapper: after normalizing, both words must be exactly 5 ASCII
+    letters a-z, which is what _compute_feedback_unchecked assumes.
     """
     guess = normalize_word(guess)
     target = normalize_word(target)
     if not (is_valid_five_letter_word(guess) and is_valid_five_letter_word(target)):
-        raise ValueError("Both guess and target must be 5-letter alphabetic words.")
+        raise ValueError("Both guess and target must be 5-letter a-z words.")
+    return _compute_feedback_unchecked(guess, target)
 
+def _compute_feedback_unchecked(guess: str, target: str) -> str:
+    """compute_wordle_feedback for words already normalized and validated (5 lowercase a-z)."""
     feedback: List[str] = ["B"] * 5
-    target_chars: List[Optional[str]] = list(target)
 
     # 1) greens
     for i, ch in enumerate(guess):
-        if ch == target_chars[i]:
+        if ch == target[i]:
             feedback[i] = "G"
-            target_chars[i] = None
 
-    # 2) yellows
+    # 2) yellows, limited by how often each letter is left in the non-green target slots
+    counts: List[int] = [0] * 26
+    for i, ch in enumerate(target):
+        if feedback[i] != "G":
+            counts[ord(ch) - 97] += 1
     for i, ch in enumerate(guess):
-        if feedback[i] == "G":
-            continue
-        if ch in target_chars:
+        idx = ord(ch) - 97
+        if feedback[i] != "G" and counts[idx] > 0:
             feedback[i] = "Y"
-            target_chars[target_chars.index(ch)] = None
+            counts[idx] -= 1
 
     return "".join(feedback)
 
+# ---------- vectorized feedback ----------
+
+# Trit value of each feedback character in a packed code: sum(trit[i] * 3**i).
+PATTERN_TRITS: Dict[str, int] = {"B": 0, "Y": 1, "G": 2}
+
+def words_to_u8(words: List[str]) -> np.ndarray:
+    """Pack clean 5-letter words into an (N, 5) uint8 array of letter indices 0..25."""
+    if not words:
+        return np.empty((0, 5), dtype=np.uint8)
+    buf = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return buf.reshape(-1, 5) - np.uint8(ord("a"))
+
+def pattern_to_code(pattern: str) -> int:
+    """Pack a G/Y/B pattern into its base-3 feedback code (0..242)."""
+    return sum(PATTERN_TRITS[ch] * 3 ** i for i, ch in enumerate(pattern))
+
+def compute_feedback_batch(guess: str, targets_u8: np.ndarray) -> np.ndarray:
+    """
+    Vectorized compute_wordle_feedback of one guess against many targets.
+    targets_u8 is an (N, 5) array from words_to_u8; returns N packed codes
+    (see pattern_to_code) as uint8.
+    """
+    guess = normalize_word(guess)
+    if not is_valid_five_letter_word(guess):
+        raise ValueError("Guess must be a 5-letter a-z word.")
+    return feedback_batch_u8(words_to_u8([guess])[0], targets_u8)
+
+def feedback_batch_u8(g: np.ndarray, targets_u8: np.ndarray) -> np.ndarray:
+    """compute_feedback_batch for a guess already packed by words_to_u8 (no validation)."""
+    n = targets_u8.shape[0]
+    rows = np.arange(n)
+
+    # 1) greens
+    green = targets_u8 == g[None, :]
+
+    # 2) yellows: per-target counts of the letters not already matched green
+    counts = np.zeros((n, 26), dtype=np.int8)
+    for i in range(5):
+        counts[rows, targets_u8[:, i]] += ~green[:, i]
+
+    codes = np.zeros(n, dtype=np.uint8)
+    for i in range(5):
+        yellow = ~green[:, i] & (counts[:, g[i]] > 0)
+        counts[yellow, g[i]] -= 1
+        codes += np.where(green[:, i], 2, yellow).astype(np.uint8) * np.uint8(3 ** i)
+    return codes
+
+_EMOJI_TABLE = str.maketrans({"G": "🟩", "Y": "🟨", "B": "⬛"})
+_WIN_EMOJIS = "🟩" * 5
+
 def pattern_to_emojis(pattern: str) -> str:
-    mapping = {"G": "🟩", "Y": "🟨", "B": "⬛"}
-    return "".join(mapping.get(ch, "⬛") for ch in pattern)
+    if pattern == "GGGGG":
+        return _WIN_EMOJIS
+    return pattern.translate(_EMOJI_TABLE)
 
+@functools.lru_cache(maxsize=1024)
 def parse_guess_from_json(content: str) -> Tuple[bool, str]:
     """
     Expect: {"guess": "abcde"}; returns (ok, guess_or_error)
     """
+    content = content or ""
+    if len(content) > 128:
+        # a valid reply is ~20 chars; don't bother parsing anything this long
+        return False, "Model response was too long to be a single JSON guess."
     try:
-        data: Dict[str, Any] = json.loads(content or "")
+        data: Dict[str, Any] = _json.loads(content)
         guess = normalize_word(str(data.get("guess", "")))
         if not is_valid_five_letter_word(guess):
             return False, "Model did not return a valid 5-letter 'guess'."
@@ -59,16 +130,32 @@ def parse_guess_from_json(content: str) -> Tuple[bool, str]:
     except Exception:
         return False, "Model did not return valid JSON with a 'guess' field."
 
-def get_today_wordle_solution() -> Optional[str]:
+# ---------- today's solution ----------
+
+# today's solution keyed by PST date; only the current day is kept
+_sol_cache: Dict[str, str] = {}
+_sol_lock = asyncio.Lock()
+
+async def get_today_wordle_solution_async() -> Optional[str]:
     pst = ZoneInfo("America/Los_Angeles")
     today = datetime.datetime.now(pst).strftime("%Y-%m-%d")
-    url = f"https://www.nytimes.com/svc/wordle/v2/{today}.json"
-    try:
-        r = requests.get(url, timeout=10)
-        if r.status_code == 200:
-            sol = r.json().get("solution")
-            if sol and is_valid_five_letter_word(sol):
-                return normalize_word(sol)
-    except Exception:
-        pass
-    return None
+    if today in _sol_cache:
+        return _sol_cache[today]
+
+    # single flight: concurrent commands wait for one fetch instead of each issuing their own
+    async with _sol_lock:
+        if today in _sol_cache:
+            return _sol_cache[today]
+        url = f"https://www.nytimes.com/svc/wordle/v2/{today}.json"
+        try:
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(url) as r:
+                    if r.status == 200:
+                        sol = (await r.json(content_type=None)).get("solution")
+                        if sol and is_valid_five_letter_word(sol):
+                            _sol_cache.clear()
+                            _sol_cache[today] = normalize_word(sol)
+        except Exception:
+            pass
+    return _sol_cache.get(today)